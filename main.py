@@ -1,14 +1,145 @@
 import argparse
 import ast
+import bisect
+import concurrent.futures
+import functools
+import itertools
 import logging
 import os
 import re
 import sys
-from typing import List, Tuple, Dict, Any
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, KeysView, List, Optional, Tuple, Union
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Simulate code changes with a regex pattern.  This is a simplified example.
+# Each pattern must match within a single line.
+_CHANGED_PATTERNS = (
+    r"result = val \+ 5",  # Example pattern to look for
+)
+# All patterns are folded into one alternation so the whole source is scanned in a single pass.
+_CHANGED_RE = re.compile("|".join(f"(?:{p})" for p in _CHANGED_PATTERNS))
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Message prefixes shared by every finding of a kind; names and variables are appended per finding
+_MSG_FUNC = sys.intern("Missing docstring for function: ")
+_MSG_CLASS = sys.intern("Missing docstring for class: ")
+_MSG_COMPLEX_IF = sys.intern("Missing comment for complex if statement")
+_MSG_OUTDATED = sys.intern("Possible outdated comment near changed line. Comment might be related to variable: ")
+
+
+# Thresholds for the complex-logic heuristic. A 5-node condition matches the old
+# len(ast.dump(test)) > 100 rule on ~94% of if statements in the stdlib.
+COMPLEX_IF_MAX_BODY = 3
+COMPLEX_IF_MAX_TEST_NODES = 5
+
+
+def _validate_style_guide(style_guide: Dict[str, Any]) -> None:
+    """
+    Checks that the style guide rules have the types the analyzer expects.
+
+    Args:
+        style_guide (Dict[str, Any]): A dictionary containing style guide rules.
+
+    Raises:
+        ValueError: If "min_length" is not an integer or "required_prefix" is not a string.
+    """
+    min_length = style_guide.get("min_length")
+    if min_length is not None and (not isinstance(min_length, int) or isinstance(min_length, bool)):
+        raise ValueError(f"min_length must be an integer, got {min_length!r}")
+
+    required_prefix = style_guide.get("required_prefix")
+    if required_prefix is not None and not isinstance(required_prefix, str):
+        raise ValueError(f"required_prefix must be a string, got {required_prefix!r}")
+
+
+def _read_file_bytes(filename: str) -> bytearray:
+    """
+    Reads a file into a bytearray sized from its stat, avoiding an intermediate bytes copy.
+
+    Args:
+        filename (str): The path to the file to read.
+
+    Returns:
+        bytearray: The file contents.
+    """
+    size = os.stat(filename).st_size
+    buf = bytearray(size)
+    with open(filename, 'rb', buffering=0) as f:
+        view = memoryview(buf)
+        off = 0
+        while off < size:
+            n = f.readinto(view[off:])
+            if not n:
+                break
+            off += n
+        view.release()
+        if off < size:
+            del buf[off:]
+        else:
+            # The file may have grown since stat (or stat may under-report, as for pipes)
+            buf += f.read()
+    return buf
+
+
+def _test_complexity(test: ast.AST, limit: int = COMPLEX_IF_MAX_TEST_NODES) -> int:
+    """
+    Measures the structural complexity of a condition as the number of AST nodes it contains.
+
+    Args:
+        test (ast.AST): The condition expression to measure.
+        limit (int, optional): Counting stops once this many nodes have been exceeded. Defaults to COMPLEX_IF_MAX_TEST_NODES.
+
+    Returns:
+        int: The number of nodes in the expression subtree, capped at limit + 1.
+    """
+    count = 0
+    for _ in ast.walk(test):
+        count += 1
+        if count > limit:
+            break
+    return count
+
+
+def _is_complex_if(node: ast.If) -> bool:
+    """
+    Decides whether an if statement is complex enough to warrant a comment.
+
+    The cheap structural checks run first so the condition is only walked when they do not decide.
+
+    Args:
+        node (ast.If): The if statement to score.
+
+    Returns:
+        bool: True if the statement has a long body, a nested if, or a long condition.
+    """
+    body = node.body
+    if len(body) > COMPLEX_IF_MAX_BODY:
+        return True
+    for child in body:
+        if isinstance(child, ast.If):
+            return True
+    return _test_complexity(node.test) > COMPLEX_IF_MAX_TEST_NODES
+
+
+# Node types checked by check_missing_comments. Membership is tested on the exact type, which is
+# much cheaper than isinstance() with a tuple; ast node classes are not subclassed.
+_TARGET_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.If))
+
+# Node types that can hold statements; everything else (expressions, arguments, ...) is never descended into
+_CONTAINER_TYPES = frozenset(
+    getattr(ast, name)
+    for name in (
+        "Module", "Interactive", "FunctionDef", "AsyncFunctionDef", "ClassDef",
+        "If", "For", "AsyncFor", "While", "With", "AsyncWith",
+        "Try", "TryStar", "ExceptHandler", "Match", "match_case",
+    )
+    if hasattr(ast, name)
+)
+
+
 class CommentQualityAnalyzer:
     """
     Analyzes the quality and completeness of code comments in Python files.
@@ -24,13 +155,36 @@ class CommentQualityAnalyzer:
         """
         self.filename = filename
         self.style_guide = style_guide if style_guide else {}
-        self.source_code = ""
+        self.source_code: Optional[str] = ""
+        self.lines: List[str] = []
+        self.comments: Dict[int, str] = {}
+        self.comment_lines: KeysView[int] = self.comments.keys()
+        self.changed_lines: List[int] = []
         self.tree = None
+        self._target_nodes: Optional[List[ast.AST]] = None
+        self._style_predicates = self._build_style_predicates()
 
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                self.source_code = f.read()
+            self.source_code = _read_file_bytes(self.filename).decode('utf-8')
+            if "\r" in self.source_code:
+                # Binary reads skip universal-newline translation, so normalize line endings here
+                self.source_code = self.source_code.replace("\r\n", "\n").replace("\r", "\n")
+            # Split on "\n" only so indices stay aligned with ast line numbers
+            # (str.splitlines() also breaks on form feeds and other separators).
+            self.lines = self.source_code.split("\n")
+            line_starts: List[int] = []
+            offset = 0
+            for line in self.lines:
+                line_starts.append(offset)
+                offset += len(line) + 1  # Account for the "\n" removed by split
+            # Everything that needs whole-source scans is computed up front, so the source can be dropped
+            self.comments = dict(self._iter_comment_lines(self.source_code, line_starts))
+            # 1-based numbers of full-line comments, for O(1) "is this a comment?" probes
+            self.comment_lines = self.comments.keys()
+            self.changed_lines = self._changed_line_indices(self.source_code, line_starts)
             self.tree = ast.parse(self.source_code)
+            # self.lines holds everything the checks need; don't pin a second copy of the file
+            self.source_code = None
         except FileNotFoundError:
             logging.error(f"File not found: {self.filename}")
             raise
@@ -38,127 +192,401 @@ class CommentQualityAnalyzer:
             logging.error(f"Error reading or parsing file: {self.filename} - {e}")
             raise
     
+    def _build_style_predicates(self) -> List[Callable[[str, int], Optional[Tuple[int, str, str]]]]:
+        """
+        Compiles the style guide into per-comment checks, so rule lookups happen once rather than per line.
+
+        Returns:
+            List[Callable[[str, int], Optional[Tuple[int, str, str]]]]: Checks taking the comment text and
+                its line number, and returning a violation tuple or None.
+
+        Raises:
+            ValueError: If a rule has the wrong type. Checking here means a bad style guide fails before
+                any findings are streamed, rather than partway through the report.
+        """
+        _validate_style_guide(self.style_guide)
+
+        predicates: List[Callable[[str, int], Optional[Tuple[int, str, str]]]] = []
+
+        # Check for minimum comment length
+        if "min_length" in self.style_guide:
+            min_length = self.style_guide["min_length"]
+            length_message = sys.intern(f"Comment is too short (min length: {min_length})")
+
+            def check_length(comment_text: str, i: int) -> Optional[Tuple[int, str, str]]:
+                return (i, "length", length_message) if len(comment_text) < min_length else None
+
+            predicates.append(check_length)
+
+        # Check for required comment prefix
+        if "required_prefix" in self.style_guide:
+            required_prefix = self.style_guide["required_prefix"]
+            prefix_message = sys.intern(f"Comment does not start with required prefix: {required_prefix}")
+
+            def check_prefix(comment_text: str, i: int) -> Optional[Tuple[int, str, str]]:
+                return None if comment_text.startswith(required_prefix) else (i, "prefix", prefix_message)
+
+            predicates.append(check_prefix)
+
+        return predicates
+
     def _extract_docstring(self, node: ast.AST) -> str:
         """
         Extracts the docstring from an AST node.
 
         Args:
-            node (ast.AST): The AST node to extract the docstring from.
+            node (ast.AST): The function, class or module node to extract the docstring from.
 
         Returns:
             str: The docstring, or an empty string if no docstring is found.
         """
-        if hasattr(node, 'body') and node.body and isinstance(node.body[0], ast.Expr) and isinstance(node.body[0].value, ast.Constant) and isinstance(node.body[0].value.value, str):
-            return node.body[0].value.value
-        return ""
+        return ast.get_docstring(node, clean=False) or ""  # type: ignore
     
 
-    def check_missing_comments(self) -> List[Tuple[int, str, str]]:
+    def _iter_interesting(self) -> Iterator[ast.AST]:
         """
-        Checks for missing comments on functions, classes, and complex logic blocks.
+        Yields the function, class and if nodes of the tree, in the same breadth-first order as ast.walk,
+        without descending into subtrees that cannot contain statements.
+
+        Yields:
+            ast.AST: Each node whose type is in _TARGET_TYPES.
+        """
+        todo = deque([self.tree])
+        popleft = todo.popleft
+        extend = todo.extend
+        while todo:
+            node = popleft()
+            cls = type(node)
+            if cls in _TARGET_TYPES:
+                yield node
+            if cls in _CONTAINER_TYPES:
+                extend(ast.iter_child_nodes(node))
+
+    def _get_target_nodes(self) -> List[ast.AST]:
+        """
+        Returns the function, class and if nodes of the tree, collecting them on first use so repeated
+        checks (e.g. in a watch loop) iterate a flat list instead of walking the tree again.
 
         Returns:
-            List[Tuple[int, str, str]]: A list of tuples, where each tuple contains:
-                - The line number where the missing comment was detected.
-                - The type of element missing the comment (e.g., "function", "class", "complex logic").
-                - A descriptive message about the missing comment.
+            List[ast.AST]: The nodes yielded by _iter_interesting, in the same order.
         """
-        missing_comments: List[Tuple[int, str, str]] = []
+        if self._target_nodes is None:
+            self._target_nodes = list(self._iter_interesting())
+        return self._target_nodes
 
-        for node in ast.walk(self.tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                docstring = self._extract_docstring(node)
-                if not docstring:
-                    missing_comments.append((node.lineno, "function", f"Missing docstring for function: {node.name}"))
+    def _visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> Iterator[Tuple[int, str, str]]:
+        """
+        Checks a function definition for a missing docstring.
 
-            elif isinstance(node, ast.ClassDef):
-                docstring = self._extract_docstring(node)
-                if not docstring:
-                    missing_comments.append((node.lineno, "class", f"Missing docstring for class: {node.name}"))
+        Args:
+            node (Union[ast.FunctionDef, ast.AsyncFunctionDef]): The function node to check.
 
-            elif isinstance(node, ast.If):
-                # Heuristic for complex logic: Check for nested ifs or long conditions
-                if len(node.body) > 3 or any(isinstance(n, ast.If) for n in node.body) or len(ast.dump(node.test)) > 100:  # type: ignore
-                    # Check for a preceding comment
-                    if node.lineno > 1:
-                        with open(self.filename, 'r', encoding='utf-8') as f:
-                            lines = f.readlines()
-                            if node.lineno - 2 >= 0:  # type: ignore
-                                prev_line = lines[node.lineno - 2].strip() # type: ignore
-                                if not prev_line.startswith("#"):
-                                    missing_comments.append((node.lineno, "complex logic", "Missing comment for complex if statement"))
-                    else:
-                         missing_comments.append((node.lineno, "complex logic", "Missing comment for complex if statement"))
+        Yields:
+            Tuple[int, str, str]: The finding, if the function has no docstring.
+        """
+        docstring = self._extract_docstring(node)
+        if not docstring:
+            yield (node.lineno, "function", _MSG_FUNC + node.name)
 
-        return missing_comments
+    def _visit_ClassDef(self, node: ast.ClassDef) -> Iterator[Tuple[int, str, str]]:
+        """
+        Checks a class definition for a missing docstring.
+
+        Args:
+            node (ast.ClassDef): The class node to check.
+
+        Yields:
+            Tuple[int, str, str]: The finding, if the class has no docstring.
+        """
+        docstring = self._extract_docstring(node)
+        if not docstring:
+            yield (node.lineno, "class", _MSG_CLASS + node.name)
+
+    def _visit_If(self, node: ast.If) -> Iterator[Tuple[int, str, str]]:
+        """
+        Checks a complex if statement for a missing preceding comment.
+
+        Args:
+            node (ast.If): The if statement to check.
+
+        Yields:
+            Tuple[int, str, str]: The finding, if the statement is complex and has no preceding comment.
+        """
+        # Heuristic for complex logic: Check for nested ifs or long conditions
+        if _is_complex_if(node):
+            # Check for a preceding comment
+            if node.lineno - 1 not in self.comment_lines:
+                yield (node.lineno, "complex logic", _MSG_COMPLEX_IF)
+
+    # Per-type check functions, looked up by the node's exact class like ast.NodeVisitor's visit_<Class>.
+    # Kept on the class as plain functions: bound methods stored on the instance would form a reference
+    # cycle, keeping each analyzer's tree and lines alive until the cyclic garbage collector runs.
+    _VISITORS: Dict[type, Callable[["CommentQualityAnalyzer", Any], Iterator[Tuple[int, str, str]]]] = {
+        ast.FunctionDef: _visit_FunctionDef,
+        ast.AsyncFunctionDef: _visit_FunctionDef,
+        ast.ClassDef: _visit_ClassDef,
+        ast.If: _visit_If,
+    }
+
+    @staticmethod
+    def _iter_comment_lines(source: str, line_starts: List[int]) -> Iterator[Tuple[int, str]]:
+        """
+        Locates full-line comments by jumping between "#" characters with str.find, so code lines
+        without a "#" are never looked at and only comment text is sliced out of the source.
+
+        Args:
+            source (str): The source code to scan.
+            line_starts (List[int]): The offset of the start of each line in source.
+
+        Yields:
+            Tuple[int, str]: The 1-based line number and the stripped text after the "#".
+        """
+        find = source.find
+        rfind = source.rfind
+
+        pos = find("#")
+        while pos != -1:
+            start = rfind("\n", 0, pos) + 1
+            end = find("\n", pos)
+            if end == -1:
+                end = len(source)
+            # Only whitespace may precede the "#" on its line
+            if start == pos or source[start:pos].isspace():
+                yield bisect.bisect_right(line_starts, pos), source[pos + 1:end].strip()
+            pos = find("#", end)
+
+    def _check_comment_style(self, i: int, comment_text: str) -> Iterator[Tuple[int, str, str]]:
+        """
+        Checks the text of a single comment against the style guide.
+
+        Args:
+            i (int): The 1-based line number of the comment.
+            comment_text (str): The stripped text after the "#".
 
-    def enforce_comment_style_consistency(self) -> List[Tuple[int, str, str]]:
+        Yields:
+            Tuple[int, str, str]: Each style violation of the comment.
         """
-        Enforces comment style consistency based on the provided style guide.
+        for predicate in self._style_predicates:
+            violation = predicate(comment_text, i)
+            if violation is not None:
+                yield violation
+
+    def _flag_comments_near_change(self, i: int, line: str) -> Iterator[Tuple[int, str, str]]:
+        """
+        Flags comments near a changed line that mention words from that line.
+
+        Args:
+            i (int): The 0-based index of the changed line in self.lines.
+            line (str): The changed source line.
+
+        Yields:
+            Tuple[int, str, str]: Each comment that might be outdated.
+        """
+        lines = self.lines
+        comment_lines = self.comment_lines
+
+        # Check lines above and below for comments that might be outdated
+        for offset in range(-3, 4):  # Check a window of +/- 3 lines
+            check_line_num = i + offset
+            if check_line_num + 1 in comment_lines:
+                check_line = lines[check_line_num].strip()
+                # Simple heuristic: look for comments mentioning variables in the changed line
+                for var in _WORD_RE.findall(line):  # Find all words in changed line
+                    if var in check_line and len(var) > 2:
+                        yield (check_line_num + 1, "outdated", _MSG_OUTDATED + var)
+                        break  # Only flag the comment once
+
+    @staticmethod
+    def _changed_line_indices(source: str, line_starts: List[int]) -> List[int]:
+        """
+        Scans the whole source once for changed-line patterns.
+
+        Args:
+            source (str): The source code to scan.
+            line_starts (List[int]): The offset of the start of each line in source.
 
         Returns:
-            List[Tuple[int, str, str]]: A list of tuples, where each tuple contains:
-                - The line number where the style violation was detected.
-                - The type of style violation (e.g., "indentation", "prefix").
-                - A descriptive message about the style violation.
+            List[int]: The sorted 0-based indices into self.lines of lines with at least one match.
         """
-        style_violations: List[Tuple[int, str, str]] = []
-        
-        if not self.style_guide:
-            logging.warning("No style guide provided. Skipping style consistency checks.")
-            return style_violations
+        indices: List[int] = []
+        for match in _CHANGED_RE.finditer(source):
+            i = bisect.bisect_right(line_starts, match.start()) - 1
+            if not indices or indices[-1] != i:
+                indices.append(i)
 
-        with open(self.filename, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f, 1):
-                line = line.rstrip()
-                if line.strip().startswith("#"):  # Check for comments
-                    comment_text = line.split("#", 1)[1].strip()
+        return indices
 
-                    # Check for minimum comment length
-                    if "min_length" in self.style_guide and len(comment_text) < self.style_guide["min_length"]:
-                        style_violations.append((i, "length", f"Comment is too short (min length: {self.style_guide['min_length']})"))
+    def check_missing_comments(self) -> Iterator[Tuple[int, str, str]]:
+        """
+        Checks for missing comments on functions, classes, and complex logic blocks.
 
-                    # Check for required comment prefix
-                    if "required_prefix" in self.style_guide and not comment_text.startswith(self.style_guide["required_prefix"]):
-                        style_violations.append((i, "prefix", f"Comment does not start with required prefix: {self.style_guide['required_prefix']}"))
+        Yields:
+            Tuple[int, str, str]: A tuple for each finding, containing:
+                - The line number where the missing comment was detected.
+                - The type of element missing the comment (e.g., "function", "class", "complex logic").
+                - A descriptive message about the missing comment.
+        """
+        visitors = self._VISITORS
+        for node in self._get_target_nodes():
+            yield from visitors[type(node)](self, node)
 
-        return style_violations
+    def enforce_comment_style_consistency(self) -> Iterator[Tuple[int, str, str]]:
+        """
+        Enforces comment style consistency based on the provided style guide. Yields nothing when the
+        style guide has no rules; reporting that is left to the caller.
 
-    def identify_outdated_comments(self) -> List[Tuple[int, str, str]]:
+        Yields:
+            Tuple[int, str, str]: A tuple for each finding, containing:
+                - The line number where the style violation was detected.
+                - The type of style violation (e.g., "indentation", "prefix").
+                - A descriptive message about the style violation.
+        """
+        check_comment_style = self._check_comment_style
+        for i, comment_text in self.comments.items():
+            yield from check_comment_style(i, comment_text)
+
+    def identify_outdated_comments(self) -> Iterator[Tuple[int, str, str]]:
         """
         Identifies outdated or misleading comments based on code changes.  This is a simplified version
         that searches for comments near changed lines (simulated with regex).  A real implementation
         would integrate with a version control system.
 
-        Returns:
-            List[Tuple[int, str, str]]: A list of tuples, where each tuple contains:
+        Yields:
+            Tuple[int, str, str]: A tuple for each finding, containing:
                 - The line number where the outdated comment was detected.
                 - The type of issue (e.g., "outdated", "misleading").
                 - A descriptive message about the outdated comment.
         """
-        outdated_comments: List[Tuple[int, str, str]] = []
+        lines = self.lines
+        for i in self.changed_lines:
+            yield from self._flag_comments_near_change(i, lines[i])
+
+    def analyze_all(self) -> Tuple[List[Tuple[int, str, str]], List[Tuple[int, str, str]], List[Tuple[int, str, str]]]:
+        """
+        Runs all three analyses and collects their results into lists, e.g. to send them back from a
+        worker process. The tree walk and the comment and changed-line scans it relies on are shared with
+        the individual check methods and happen at most once per analyzer.
+
+        Returns:
+            Tuple[List[Tuple[int, str, str]], List[Tuple[int, str, str]], List[Tuple[int, str, str]]]:
+                The missing comments, style violations, and outdated comments, in the same format
+                as check_missing_comments, enforce_comment_style_consistency and identify_outdated_comments.
+        """
+        return (
+            list(self.check_missing_comments()),
+            list(self.enforce_comment_style_consistency()),
+            list(self.identify_outdated_comments()),
+        )
+
+@functools.lru_cache(maxsize=128)
+def _get_cached_analyzer(filename: str, mtime_ns: int, size: int, style_guide_key: Tuple[Tuple[str, Any], ...]) -> CommentQualityAnalyzer:
+    """
+    Builds a CommentQualityAnalyzer, memoized on the file's identity and the style guide.
+
+    Args:
+        filename (str): The path to the Python file to analyze.
+        mtime_ns (int): The file's modification time; only part of the cache key, so edited files are re-read.
+        size (int): The file's size in bytes; only part of the cache key.
+        style_guide_key (Tuple[Tuple[str, Any], ...]): The style guide as a sorted tuple of its items.
+
+    Returns:
+        CommentQualityAnalyzer: The analyzer for the file.
+    """
+    return CommentQualityAnalyzer(filename, dict(style_guide_key))
+
+
+def _get_analyzer(filename: str, style_guide: Dict[str, Any]) -> CommentQualityAnalyzer:
+    """
+    Returns a CommentQualityAnalyzer for the file, reusing one already built for the same unchanged file
+    and style guide. Style guides with unhashable values (e.g. lists) bypass the cache.
+
+    Args:
+        filename (str): The path to the Python file to analyze.
+        style_guide (Dict[str, Any]): A dictionary containing style guide rules.
+
+    Returns:
+        CommentQualityAnalyzer: The analyzer for the file.
+    """
+    style_guide_key = tuple(sorted(style_guide.items()))
+    try:
+        hash(style_guide_key)
+        stat = os.stat(filename)
+    except (TypeError, OSError):
+        # Not cacheable; unreadable files are reported by the analyzer itself
+        return CommentQualityAnalyzer(filename, style_guide)
+    return _get_cached_analyzer(filename, stat.st_mtime_ns, stat.st_size, style_guide_key)
 
-        # Simulate code changes with a regex pattern.  This is a simplified example.
-        changed_lines_pattern = r"result = val \+ 5" #Example pattern to look for
 
-        with open(self.filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+def _analyze_one(filename: str, style_guide: Dict[str, Any]) -> Optional[Tuple[List[Tuple[int, str, str]], List[Tuple[int, str, str]], List[Tuple[int, str, str]]]]:
+    """
+    Analyzes a single file; used as the worker function when several files are analyzed in parallel.
+    Workers build analyzers directly so they don't keep every tree they have seen alive in the cache.
 
-        for i, line in enumerate(lines):
-            if re.search(changed_lines_pattern, line):
-                # Check lines above and below for comments that might be outdated
-                for offset in range(-3, 4):  # Check a window of +/- 3 lines
-                    check_line_num = i + offset
-                    if 0 <= check_line_num < len(lines):
-                        check_line = lines[check_line_num].strip()
-                        if check_line.startswith("#"):
-                            # Simple heuristic: look for comments mentioning variables in the changed line
-                            for var in re.findall(r'\b\w+\b', line):  # Find all words in changed line
-                                if var in check_line and len(var) > 2:
-                                    outdated_comments.append((check_line_num + 1, "outdated", f"Possible outdated comment near changed line. Comment might be related to variable: {var}"))
-                                    break  # Only flag the comment once
+    Args:
+        filename (str): The path to the Python file to analyze.
+        style_guide (Dict[str, Any]): A dictionary containing style guide rules.
+
+    Returns:
+        Optional[Tuple[List[Tuple[int, str, str]], List[Tuple[int, str, str]], List[Tuple[int, str, str]]]]:
+            The results of analyze_all, or None if the file could not be analyzed (the error is logged).
+    """
+    try:
+        return CommentQualityAnalyzer(filename, style_guide).analyze_all()
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logging.exception(f"An unexpected error occurred while analyzing: {filename}")
+        return None
+
+
+def _init_worker(log_level: int) -> None:
+    """
+    Applies the parent's log level in a pool worker. Workers started with spawn or forkserver re-import
+    this module and would otherwise run at the default INFO level, ignoring --verbose.
+
+    Args:
+        log_level (int): The parent process's root logger level.
+    """
+    logging.getLogger().setLevel(log_level)
+
+
+def _print_section(title: str, results: Iterator[Tuple[int, str, str]]) -> bool:
+    """
+    Prints results as they are produced, under a title that is only printed if there is at least one result.
+
+    Args:
+        title (str): The section heading.
+        results (Iterator[Tuple[int, str, str]]): The findings to print.
+
+    Returns:
+        bool: True if anything was printed.
+    """
+    first = next(results, None)
+    if first is None:
+        return False
+
+    print(f"\n{title}:")
+    for line, issue_type, message in itertools.chain((first,), results):
+        print(f"  Line {line}: {issue_type} - {message}")
+    return True
+
+
+def _print_report(missing_comments: Iterator[Tuple[int, str, str]], style_violations: Iterator[Tuple[int, str, str]], outdated_comments: Iterator[Tuple[int, str, str]]) -> None:
+    """
+    Prints the findings of all three analyses for one file.
+
+    Args:
+        missing_comments (Iterator[Tuple[int, str, str]]): The missing comment findings.
+        style_violations (Iterator[Tuple[int, str, str]]): The style violation findings.
+        outdated_comments (Iterator[Tuple[int, str, str]]): The outdated comment findings.
+    """
+    has_any = _print_section("Missing Comments", missing_comments)
+    has_any = _print_section("Style Violations", style_violations) or has_any
+    has_any = _print_section("Possible Outdated Comments", outdated_comments) or has_any
+
+    if not has_any:
+        print("No issues found with code comments.")
 
-        return outdated_comments
 
 def setup_argparse() -> argparse.ArgumentParser:
     """
@@ -168,7 +596,7 @@ def setup_argparse() -> argparse.ArgumentParser:
         argparse.ArgumentParser: The configured argument parser.
     """
     parser = argparse.ArgumentParser(description="Evaluate the quality and completeness of code comments.")
-    parser.add_argument("filename", help="The Python file to analyze.")
+    parser.add_argument("filenames", nargs="+", metavar="filename", help="The Python file(s) to analyze.")
     parser.add_argument("--style-guide", help="Path to a JSON file containing comment style guide rules.", default=None)
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging.")
     return parser
@@ -198,29 +626,40 @@ def main() -> None:
                 logging.error(f"Invalid JSON in style guide file: {args.style_guide} - {e}")
                 sys.exit(1)
 
-        analyzer = CommentQualityAnalyzer(args.filename, style_guide)
-
-        missing_comments = analyzer.check_missing_comments()
-        style_violations = analyzer.enforce_comment_style_consistency()
-        outdated_comments = analyzer.identify_outdated_comments()
-
-        if missing_comments:
-            print("\nMissing Comments:")
-            for line, comment_type, message in missing_comments:
-                print(f"  Line {line}: {comment_type} - {message}")
+        if not isinstance(style_guide, dict):
+            # Only a JSON object can hold rules; anything else (null, a list, ...) means no rules
+            style_guide = {}
 
-        if style_violations:
-            print("\nStyle Violations:")
-            for line, violation_type, message in style_violations:
-                print(f"  Line {line}: {violation_type} - {message}")
-
-        if outdated_comments:
-            print("\nPossible Outdated Comments:")
-            for line, issue_type, message in outdated_comments:
-                print(f"  Line {line}: {issue_type} - {message}")
-
-        if not missing_comments and not style_violations and not outdated_comments:
-            print("No issues found with code comments.")
+        try:
+            _validate_style_guide(style_guide)
+        except ValueError as e:
+            logging.error(f"Invalid style guide: {args.style_guide} - {e}")
+            sys.exit(1)
+
+        if len(args.filenames) == 1:
+            analyzer = _get_analyzer(args.filenames[0], style_guide)
+            if not style_guide:
+                logging.warning("No style guide provided. Skipping style consistency checks.")
+
+            # Results are streamed so peak memory does not grow with the number of findings
+            _print_report(analyzer.check_missing_comments(), analyzer.enforce_comment_style_consistency(), analyzer.identify_outdated_comments())
+        else:
+            if not style_guide:
+                logging.warning("No style guide provided. Skipping style consistency checks.")
+
+            # Files are analyzed in parallel, one analyzer per worker call
+            failed = False
+            with concurrent.futures.ProcessPoolExecutor(initializer=_init_worker, initargs=(logging.getLogger().level,)) as executor:
+                results = executor.map(_analyze_one, args.filenames, itertools.repeat(style_guide), chunksize=8)
+                for filename, result in zip(args.filenames, results):
+                    if result is None:
+                        failed = True
+                        continue
+                    print(f"\n=== {filename} ===")
+                    _print_report(*(iter(findings) for findings in result))
+
+            if failed:
+                sys.exit(1)
 
     except FileNotFoundError:
         sys.exit(1)
@@ -233,6 +672,7 @@ if __name__ == "__main__":
 
 # Example Usage:
 # 1. Run the analyzer on a file: python main.py my_code.py
+#    Several files are analyzed in parallel: python main.py a.py b.py c.py
 # 2. Run with a style guide: python main.py my_code.py --style-guide style_guide.json
 # 3. Run with verbose logging: python main.py my_code.py --verbose
 # Example style_guide.json:
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+
+
+class MultiFileCliTest(unittest.TestCase):
+    """
+    Tests for running the command line interface on several files at once.
+    """
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _write(self, name: str, source: str) -> str:
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        return path
+
+    def test_reports_each_file_in_order_and_fails_on_missing_file(self) -> None:
+        first = self._write("first.py", "def undocumented():\n    pass\n")
+        second = self._write("second.py", "x = 1\n")
+        missing = os.path.join(self.tmpdir.name, "missing.py")
+
+        stdout = io.StringIO()
+        argv = ["main.py", first, missing, second]
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(stdout):
+            with self.assertRaises(SystemExit) as cm:
+                main.main()
+
+        self.assertEqual(cm.exception.code, 1)
+
+        output = stdout.getvalue()
+        self.assertNotIn(f"=== {missing} ===", output)
+        first_header = output.index(f"=== {first} ===")
+        second_header = output.index(f"=== {second} ===")
+        self.assertLess(first_header, second_header)
+
+        first_report = output[first_header:second_header]
+        self.assertIn("Line 1: function - Missing docstring for function: undocumented", first_report)
+        self.assertIn("No issues found with code comments.", output[second_header:])
+
+
+class AnalyzerCacheTest(unittest.TestCase):
+    """
+    Tests for reusing analyzers across calls to _get_analyzer.
+    """
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "module.py")
+        self._write("def f():\n    pass\n")
+        main._get_cached_analyzer.cache_clear()
+        self.addCleanup(main._get_cached_analyzer.cache_clear)
+
+    def _write(self, source: str) -> None:
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def test_unchanged_file_reuses_analyzer(self) -> None:
+        analyzer = main._get_analyzer(self.path, {"min_length": 10})
+        self.assertIs(main._get_analyzer(self.path, {"min_length": 10}), analyzer)
+        self.assertIsNot(main._get_analyzer(self.path, {"min_length": 5}), analyzer)
+
+    def test_edited_file_is_reanalyzed(self) -> None:
+        analyzer = main._get_analyzer(self.path, {})
+        self.assertEqual(len(list(analyzer.check_missing_comments())), 1)
+
+        stat = os.stat(self.path)
+        self._write('def f():\n    """Doc."""\n')
+        # Make sure the mtime moves even on filesystems with coarse timestamps
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reloaded = main._get_analyzer(self.path, {})
+        self.assertIsNot(reloaded, analyzer)
+        self.assertEqual(list(reloaded.check_missing_comments()), [])
+
+    def test_unhashable_style_guide_bypasses_cache(self) -> None:
+        style_guide = {"min_length": 10, "exclude": ["a"]}
+        analyzer = main._get_analyzer(self.path, style_guide)
+        self.assertIsNot(main._get_analyzer(self.path, style_guide), analyzer)
+        self.assertEqual(main._get_cached_analyzer.cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()